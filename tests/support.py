@@ -0,0 +1,22 @@
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_PATH = os.path.join(ROOT, "Invest Europe Reframe Venture Validator.py")
+MODULE_NAME = "invest_europe_reframe_venture_validator"
+
+def load_validator():
+    """
+    Imports the validator app, whose file name has spaces and so cannot be imported by name. It is loaded once and
+    shared by every test module.
+    """
+    module = sys.modules.get(MODULE_NAME)
+    if module is None:
+        if ROOT not in sys.path:
+            sys.path.insert(0, ROOT)
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,54 @@
+import io
+import unittest
+
+from werkzeug.datastructures import FileStorage
+
+from tests.support import load_validator
+
+validator_app = load_validator()
+
+HEADER = b"COMPOUND_ID,REPORTING_PERIOD,UNIT,VALUE,STATUS,COMMENTS\r\n"
+IMPORT_FILE = HEADER + b"gp_name,2024,,Acme Capital,provided,\r\ncode_of_conduct,2024,,yes,provided,\r\n"
+
+def make_upload(content: bytes) -> FileStorage:
+    return FileStorage(stream=io.BytesIO(content), filename="upload.csv")
+
+class TestCheckCsvUpload(unittest.TestCase):
+
+    def test_accepts_import_file(self):
+        self.assertIsNone(validator_app.check_csv_upload(make_upload(IMPORT_FILE)))
+
+    def test_accepts_file_of_maximum_size(self):
+        max_bytes = validator_app.app.config["MAX_CSV_BYTES"]
+        content = IMPORT_FILE + b" " * (max_bytes - len(IMPORT_FILE))
+        self.assertIsNone(validator_app.check_csv_upload(make_upload(content)))
+
+    def test_rejects_oversize_file(self):
+        max_bytes = validator_app.app.config["MAX_CSV_BYTES"]
+        content = IMPORT_FILE + b" " * (max_bytes + 1 - len(IMPORT_FILE))
+        reason = validator_app.check_csv_upload(make_upload(content))
+        self.assertEqual(reason, f"File is too large ({max_bytes + 1} bytes). The maximum size is {max_bytes} bytes.")
+
+    def test_rejects_nul_byte(self):
+        reason = validator_app.check_csv_upload(make_upload(HEADER + b"gp_name,2024,,Acme\x00,provided,\r\n"))
+        self.assertEqual(reason, "File is not a text CSV file.")
+
+    def test_rejects_utf16_file(self):
+        reason = validator_app.check_csv_upload(make_upload(IMPORT_FILE.decode().encode("utf-16")))
+        self.assertEqual(reason, "File is not a text CSV file.")
+
+    def test_leaves_stream_at_start(self):
+        upload = make_upload(IMPORT_FILE)
+        validator_app.check_csv_upload(upload)
+        self.assertEqual(upload.stream.read(), IMPORT_FILE)
+
+    def test_accepts_and_reads_file_with_byte_order_mark(self):
+        upload = make_upload(b"\xef\xbb\xbf" + IMPORT_FILE)
+        self.assertIsNone(validator_app.check_csv_upload(upload))
+
+        company_data = validator_app.read_and_organize_csv(upload.stream, "company")["company"]
+        self.assertEqual(company_data["metrics"], {"gp_name": "Acme Capital", "code_of_conduct": "yes"})
+        self.assertEqual(company_data["status"], {"gp_name": "provided", "code_of_conduct": "provided"})
+
+if __name__ == "__main__":
+    unittest.main()
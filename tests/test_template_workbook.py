@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import openpyxl
+
+from tests.support import load_validator
+
+validator_app = load_validator()
+
+class TestLoadTemplateWorkbook(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.template_path = os.path.join(directory.name, "template.xlsx")
+        self.save_template("first version", mtime=1_700_000_000)
+
+    def save_template(self, value: str, mtime: int):
+        workbook = openpyxl.Workbook()
+        workbook.active["A1"] = value
+        workbook.save(self.template_path)
+        os.utime(self.template_path, (mtime, mtime))
+
+    def load_counting_parses(self):
+        with mock.patch.object(validator_app.openpyxl, "load_workbook", wraps=openpyxl.load_workbook) as load_workbook:
+            workbook = validator_app.load_template_workbook(self.template_path)
+        return workbook, load_workbook.call_count
+
+    def test_parses_unchanged_template_once(self):
+        workbook, parses = self.load_counting_parses()
+        self.assertEqual(workbook.active["A1"].value, "first version")
+        self.assertEqual(parses, 1)
+
+        workbook, parses = self.load_counting_parses()
+        self.assertEqual(workbook.active["A1"].value, "first version")
+        self.assertEqual(parses, 0)
+
+    def test_returns_independent_copies(self):
+        workbook = validator_app.load_template_workbook(self.template_path)
+        workbook.active["A1"] = "filled in by an export"
+
+        self.assertEqual(validator_app.load_template_workbook(self.template_path).active["A1"].value, "first version")
+
+    def test_reloads_template_when_modified(self):
+        validator_app.load_template_workbook(self.template_path)
+        self.save_template("second version", mtime=1_700_000_060)
+
+        workbook, parses = self.load_counting_parses()
+        self.assertEqual(workbook.active["A1"].value, "second version")
+        self.assertEqual(parses, 1)
+
+if __name__ == "__main__":
+    unittest.main()
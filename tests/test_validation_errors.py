@@ -0,0 +1,77 @@
+import math
+import unittest
+
+from cerberus import Validator
+
+from tests.support import load_validator
+
+validator_app = load_validator()
+
+# Raw CSV values tried for every metric, typed the way uploads are
+RAW_VALUES = ("", "abc", "yes", "no", "0", "7", "-3", "3.5", "1e3", " 7", "inf", "-inf", "nan")
+
+# Whole-schema documents validated per schema, on top of every value validated on its own
+MIXED_DOCUMENTS = 5
+
+def get_candidate_values(schema: dict, compound_id: str) -> list:
+    """
+    Returns the values to validate for a compound_id: the raw CSV values and allowed values typed like an upload,
+    plus typed values on and just outside its min/max bounds and, for floats, infinities and NaN.
+    """
+    rules = schema[compound_id]
+    raw_values = list(RAW_VALUES)
+    if "allowed" in rules:
+        raw_values += [*rules["allowed"], "not_an_option"]
+    values = [validator_app.get_typed_value(schema, raw_value, compound_id) for raw_value in raw_values]
+
+    for bound in ("min", "max"):
+        if bound in rules:
+            values += [rules[bound], rules[bound] - 1, rules[bound] + 1, rules[bound] - 0.5, rules[bound] + 0.5]
+    if rules.get("type") == "float":
+        values += [math.inf, -math.inf, math.nan]
+    return values
+
+class TestGetValidationErrors(unittest.TestCase):
+    """get_validation_errors must report exactly what a plain Cerberus Validator reports."""
+
+    def assert_matches_cerberus(self, schema: dict):
+        candidates = {compound_id: get_candidate_values(schema, compound_id) for compound_id in schema}
+        plain_validator = Validator(schema)
+
+        # A few whole documents, each metric's candidate staggered by its position, so every document mixes passing
+        # and failing values and the doubtful ones are validated together
+        for i in range(MIXED_DOCUMENTS):
+            document = {
+                compound_id: values[(i + position) % len(values)]
+                for position, (compound_id, values) in enumerate(candidates.items())
+            }
+            plain_validator.validate(document)
+            with self.subTest(document=i):
+                self.assertEqual(validator_app.get_validation_errors(schema, document), plain_validator.errors)
+
+        # One metric at a time, so a value is also checked without any other value being doubtful. A one-field
+        # document only meets that field's rules, so a Validator of those rules alone reports the same errors
+        for compound_id, values in candidates.items():
+            field_validator = Validator({compound_id: schema[compound_id]})
+            for value in values:
+                document = {compound_id: value}
+                field_validator.validate(document)
+                with self.subTest(compound_id=compound_id, value=value):
+                    self.assertEqual(validator_app.get_validation_errors(schema, document), field_validator.errors)
+
+    def test_portco_schema(self):
+        self.assert_matches_cerberus(validator_app.SCHEMA_PORTCO)
+
+    def test_fund_schema(self):
+        self.assert_matches_cerberus(validator_app.SCHEMA_FUND)
+
+    def test_gp_schema(self):
+        self.assert_matches_cerberus(validator_app.SCHEMA_GP)
+
+    def test_valid_document_has_no_errors(self):
+        schema = validator_app.SCHEMA_GP
+        document = {"gp_name": "Acme Capital", "code_of_conduct": "yes", "emission_reduction_target": 100.0}
+        self.assertEqual(validator_app.get_validation_errors(schema, document), {})
+
+if __name__ == "__main__":
+    unittest.main()
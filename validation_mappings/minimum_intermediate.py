@@ -448,4 +448,11 @@ ALL_METRICS = [
   "cyber_other",
   "cyber_other_specify",
   "cyber_no_programme"
-]
\ No newline at end of file
+]
+
+# Frozen copies of the lists above for membership tests; the lists keep their order for iteration
+MINIMUM_SET = frozenset(MINIMUM_METRICS)
+INTERMEDIATE_SET = frozenset(INTERMEDIATE_METRICS)
+FULL_SET = frozenset(FULL_METRICS)
+OPTIONAL_SET = frozenset(OPTIONAL_METRICS)
+ALL_METRICS_SET = frozenset(ALL_METRICS)
@@ -513,4 +513,7 @@ REQUIRED_FUND_METRICS = [
     "number_of_partners_non_disclosed",
     "number_of_partners_male",
     "gender_diversity_pipeline_tracked",
-]
\ No newline at end of file
+]
+# Set forms of the metric lists above, for membership tests
+ALL_FUND_METRICS_SET = frozenset(ALL_FUND_METRICS)
+REQUIRED_FUND_METRICS_SET = frozenset(REQUIRED_FUND_METRICS)
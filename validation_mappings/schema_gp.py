@@ -339,10 +339,6 @@ SCHEMA_GP = {
     #Float (positive)
     "number_of_ftes_end_of_report_year_male":  {"type": "float", 'min': 0},
     
-    #2.2.1
-    #Float (positive)
-    "turnover_fte":  {"type": "float", 'min': 0},
-    
     #2.1.6
     #Integer (positive)
     "total_number_of_partners": {"type": "integer", 'min': 0},
@@ -363,6 +359,10 @@ SCHEMA_GP = {
     #Integer (positive)
     "number_of_partners_male": {"type": "integer", 'min': 0},
     
+    #2.2.1
+    #Float (positive)
+    "turnover_fte":  {"type": "float", 'min': 0},
+    
     # New in 2025
     # 2.3.1
     #STRING from whistleblower_procedure
@@ -401,70 +401,11 @@ GP_COMPOUND_ID_UNITS = {
 
 }
 
-ALL_GP_METRICS = [
-    "gp_name",
-    "use_of_international_disclosing_standard",
-    "use_of_international_disclosing_standard_tcfd",
-    "use_of_international_disclosing_standard_gri",
-    "use_of_international_disclosing_standard_sasb",
-    "use_of_international_disclosing_standard_tnfd",
-    "use_of_international_disclosing_standard_sbti",
-    "use_of_international_disclosing_standard_cdp",
-    "use_of_international_disclosing_standard_other",
-    "use_of_international_disclosing_standard_other_specify",
-    "use_of_international_disclosing_standard_issb",
-    "use_of_international_disclosing_standard_esrs",
-    "participates_in_sustainability_climate_initiatives",
-    "participates_in_sustainability_climate_initiatives_pri",
-    "participates_in_sustainability_climate_initiatives_nzami",
-    "participates_in_sustainability_climate_initiatives_ici",
-    "participates_in_sustainability_climate_initiatives_transition_pathway_initiative",
-    "participates_in_sustainability_climate_initiatives_other",
-    "participates_in_sustainability_climate_initiatives_other_specify",
-    "participates_in_sustainability_climate_initiatives_smi",
-    "code_of_conduct",
-    "overall_sustainability_policy",
-    "environmental_policy",
-    "anti_discrimination_and_equal_opportunities_policy",
-    "diversity_inclusion_policy",
-    "salary_remuneration_policy",
-    "health_and_safety_policy",
-    "human_rights_policy",
-    "anti_corruption_bribery_policy",
-    "data_privacy_security_policy",
-    "supply_chain_policy",
-    "cybersecurity_data_management_policy",
-    "number_of_esg_incidents",
-    "qualitative_info_esg_incidents",
-    "major_open_litigations",
-    "ems_implemented",
-    "environmental_risk_tools",
-    "ghg_scope_measured_calculated",
-    "total_ghg_emissions",
-    "total_scope_1_emissions",
-    "total_scope_1_emissions_methodology",
-    "total_scope_2_emissions",
-    "total_scope_2_emissions_methodology",
-    "total_scope_3_emissions",
-    "total_scope_3_emissions_methodology",
-    "total_scope_3_emissions_financed_emissions",
-    "carbon_offset_tco2e",
-    "emission_reduction_target",
-    "total_ftes_end_of_report_year",
-    "number_of_ftes_end_of_report_year_female",
-    "number_of_ftes_end_of_report_year_non_binary",
-    "number_of_ftes_end_of_report_year_non_disclosed",
-    "number_of_ftes_end_of_report_year_male",
-    "total_number_of_partners",
-    "number_of_partners_female",
-    "number_of_partners_non_binary",
-    "number_of_partners_non_disclosed",
-    "number_of_partners_male",
-    "turnover_fte",
-    "implemented_whistleblower_procedure",
-    "number_of_data_breaches"
-]
+# Every GP metric, in the order of the schema, which is the order results are reported in
+ALL_GP_METRICS = tuple(SCHEMA_GP)
 
+# Strongly recommended GP metrics. Kept as its own list rather than derived from SCHEMA_GP: it also names the
+# environmental_impact_* metrics, which have no schema entry, and its length is the completion denominator
 REQUIRED_GP_METRICS = [
     "gp_name",
     "use_of_international_disclosing_standard",
@@ -514,4 +455,12 @@ REQUIRED_GP_METRICS = [
     "emission_reduction_target",
     "number_of_esg_incidents",
     "major_open_litigations",
-]
\ No newline at end of file
+]
+
+# Set forms of the metric lists above, for membership tests
+ALL_GP_METRICS_SET = frozenset(ALL_GP_METRICS)
+REQUIRED_GP_METRICS_SET = frozenset(REQUIRED_GP_METRICS)
+
+# The sets only stand in for the lists while neither list names a compound_id twice (checked unless run with -O)
+assert len(ALL_GP_METRICS_SET) == len(ALL_GP_METRICS), "ALL_GP_METRICS lists a compound_id more than once"
+assert len(REQUIRED_GP_METRICS_SET) == len(REQUIRED_GP_METRICS), "REQUIRED_GP_METRICS lists a compound_id more than once"